@@ -2,19 +2,33 @@
 """Hide/show folders in workspace
 """
 
+import asyncio
+import json
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import anyconfig
-import pyjson5
 import vscode
-from addict import Dict as AttrDict
 from vscode.context import Context
 
 ext = vscode.Extension(name="Hide Folder")
 
+# workspace JSON file path, cached after the first lookup
+_WS_PATH_CACHE: Path | None = None
+
+# JSON5 `loads` of the chosen parser backend, resolved on first use
+_JSON5_LOADS: Callable[[str], Any] | None = None
+
+# quick pick script for show_folder, `{paths}` is a JSON encoded string literal
+_SHOW_PICK_JS = """
+    vscode.window.showQuickPick(
+        JSON.parse({paths}),
+        {{
+            placeHolder: 'Select a folder to show'
+        }}
+    )
+"""
 
 @ext.event
 async def on_activate():
@@ -51,6 +65,11 @@ async def get_workspace_json(ctx: Context) -> Path:
     Returns:
         Path: The workspace JSON file path
     """
+    global _WS_PATH_CACHE  # pylint: disable=global-statement
+
+    if _WS_PATH_CACHE is not None and _WS_PATH_CACHE.is_file():
+        return _WS_PATH_CACHE
+
     try:
         json_path = Path(
             await ext.ws.run_code(
@@ -65,35 +84,70 @@ async def get_workspace_json(ctx: Context) -> Path:
         await show_error(ctx, exc)
         return Path()
 
+    _WS_PATH_CACHE = json_path
     return json_path
 
 
-async def read_workspace_json(ctx: Context) -> AttrDict:
+async def read_workspace_json(
+    ctx: Context,
+    json_path: Path | None = None,
+) -> dict:
     """Read the workspace JSON file without comments.
 
     Args:
         ctx (Context): Current context
+        json_path (Path | None): Pre-fetched workspace JSON file path.
+            Looked up via `get_workspace_json` if not given.
 
     Returns:
-        AttrDict: The workspace JSON
+        dict: The workspace JSON
     """
-    json_path = await get_workspace_json(ctx)
-
-    with open(json_path, "r", encoding="utf-8", errors="ignore") as fp:
-        json_dict = AttrDict(pyjson5.load(fp))  # pylint: disable=no-member
+    global _JSON5_LOADS  # pylint: disable=global-statement
+
+    if json_path is None:
+        json_path = await get_workspace_json(ctx)
+
+    # imported on first parse to keep extension activation lean
+    if _JSON5_LOADS is None:
+        try:
+            # Rust-backed JSON5 parser, much faster than pyjson5; only
+            # published as macOS wheels, so other platforms use pyjson5
+            import o3json5 as json5  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            import pyjson5 as json5  # pylint: disable=import-outside-toplevel
+        _JSON5_LOADS = json5.loads  # pylint: disable=no-member
+
+    # read in a worker thread to keep the event loop responsive
+    json_text = await asyncio.to_thread(
+        json_path.read_text,
+        encoding="utf-8",
+        errors="ignore",
+    )
+    json_dict = _JSON5_LOADS(json_text)
 
     return json_dict
 
 
-async def write_workspace_json(ctx: Context, json_dict: dict) -> None:
+async def write_workspace_json(
+    ctx: Context,
+    json_dict: dict,
+    json_path: Path | None = None,
+) -> None:
     """Read the workspace JSON file without comments.
 
     Args:
         ctx (Context): Current context
         json_dict (dict): The workspace JSON
+        json_path (Path | None): Pre-fetched workspace JSON file path.
+            Looked up via `get_workspace_json` if not given.
     """
-    json_path = await get_workspace_json(ctx)
-    anyconfig.dump(json_dict, json_path, "json", indent=4)
+    if json_path is None:
+        json_path = await get_workspace_json(ctx)
+    await asyncio.to_thread(
+        json_path.write_text,
+        json.dumps(json_dict, indent=4),
+        encoding="utf-8",
+    )
     return json_dict
 
 
@@ -104,26 +158,25 @@ async def hide_folder(ctx: Context):
     Args:
         ctx (Context): Current context.
     """
-    json_dict = await read_workspace_json(ctx)
+    json_path = await get_workspace_json(ctx)
+    json_dict = await read_workspace_json(ctx, json_path)
+    folders = json_dict.setdefault("folders", [])
 
-    if len(json_dict.folders) < 2:
+    if len(folders) < 2:
         return await show_error(ctx, "Cannot hide the last folder.")
 
-    # find the folder to hide
-    one_ws_folder = await ext.ws.run_code(
+    # find the folder to hide and the workspace root path in one round trip
+    one_ws_folder, ws_root = await ext.ws.run_code(
         """
-        vscode.commands.executeCommand('copyFilePath')
-        vscode.env.clipboard.readText()
+        vscode.commands.executeCommand('copyFilePath').then(
+            () => vscode.env.clipboard.readText().then(
+                (path) => [path, vscode.workspace.rootPath]
+            )
+        )
         """,
         thenable=True,
     )
 
-    # get workspace root path
-    ws_root = await ext.ws.run_code(
-        "vscode.workspace.rootPath",
-        thenable=False,
-    )
-
     # change to workspace root path for relative paths
     os.chdir(ws_root)
 
@@ -137,31 +190,37 @@ async def hide_folder(ctx: Context):
     abs_folders = []
 
     # hidden folders in workspace
-    hidden_folders = json_dict.settings.get(f"{ext.name}.hidden_folders", [])
+    settings = json_dict.setdefault("settings", {})
+    hidden_folders = settings.get(f"{ext.name}.hidden_folders", [])
+
+    target_str = str(one_ws_folder)
 
-    for one_folder in json_dict.folders:
-        new_folder_dict = AttrDict()
+    for one_folder in folders:
+        # update path to absolute path, an exact match is already resolved
+        folder_path = one_folder["path"]
+        if folder_path != target_str:
+            folder_path = str(Path(folder_path).resolve())
 
-        # update path to absolute path
-        new_folder_dict.path = str(Path(one_folder.path).resolve())
+        new_folder_dict = {"path": folder_path}
 
         # update name if exists
-        if one_folder.name:
-            new_folder_dict.name = one_folder.name
+        name = one_folder.get("name")
+        if name:
+            new_folder_dict["name"] = name
 
         # record the folder in hidden_folders setting section
-        if new_folder_dict.path == str(one_ws_folder):
+        if folder_path == target_str:
             hidden_folders.append(new_folder_dict)
             continue
 
         # dont touch other folders
         abs_folders.append(new_folder_dict)
 
-    json_dict.settings[f"{ext.name}.hidden_folders"] = hidden_folders
-    json_dict.folders = abs_folders
+    settings[f"{ext.name}.hidden_folders"] = hidden_folders
+    json_dict["folders"] = abs_folders
     # endregion: hide the folder by moving it to hidden_folders setting section
 
-    await write_workspace_json(ctx, json_dict)
+    await write_workspace_json(ctx, json_dict, json_path)
 
     return await show_info(ctx, f"{one_ws_folder} is hidden.")
 
@@ -173,45 +232,38 @@ async def show_folder(ctx: Context):
     Args:
         ctx (Context): Current context.
     """
-    json_dict = await read_workspace_json(ctx)
+    json_path = await get_workspace_json(ctx)
+    json_dict = await read_workspace_json(ctx, json_path)
+    folders = json_dict.setdefault("folders", [])
 
     # hidden folders in workspace
-    hidden_folders = json_dict.settings.get(f"{ext.name}.hidden_folders", [])
+    settings = json_dict.setdefault("settings", {})
+    hidden_folders = settings.get(f"{ext.name}.hidden_folders", [])
 
-    paths = [one_folder.path for one_folder in hidden_folders]
+    paths = [one_folder["path"] for one_folder in hidden_folders]
 
     if not paths:
         return await show_error(ctx, "No hidden folders to show.")
 
+    # paths are JSON encoded twice so quotes in folder names stay literal
     path_to_show = await ext.ws.run_code(
-        f"""
-            vscode.window.showQuickPick(
-                {paths},
-                {{
-                    placeHolder: 'Select a folder to show'
-                }}
-            )
-        """,
+        _SHOW_PICK_JS.format(paths=json.dumps(json.dumps(paths))),
         thenable=True,
     )
 
     # show folder
-    for one_folder in hidden_folders:
-        if one_folder.path != path_to_show:
-            continue
-        if one_folder not in json_dict.folders:
-            json_dict.folders += [one_folder]
-        break
+    folder_paths = {one_folder["path"] for one_folder in folders}
+    if path_to_show in paths and path_to_show not in folder_paths:
+        folders.append(hidden_folders[paths.index(path_to_show)])
 
     # remove folder from hidden_folders
-    json_dict.settings[f"{ext.name}.hidden_folders"] = []
-
-    for one_folder in hidden_folders:
-        if one_folder.path == path_to_show:
-            continue
-        json_dict.settings[f"{ext.name}.hidden_folders"] += [one_folder]
+    settings[f"{ext.name}.hidden_folders"] = [
+        one_folder
+        for one_folder in hidden_folders
+        if one_folder["path"] != path_to_show
+    ]
 
-    await write_workspace_json(ctx, json_dict)
+    await write_workspace_json(ctx, json_dict, json_path)
 
     return await show_info(ctx, f"Showing {path_to_show}")
 
@@ -220,15 +272,17 @@ def update_package_json() -> None:
     """Update package.json."""
 
     repo_root = Path(__file__).resolve().parent
-    package_json = AttrDict(anyconfig.load(repo_root / "package.json"))
-    package_json.displayName = "Hide Folder"
-    package_json.description = __doc__.strip()
-    for cmd in package_json.contributes.commands:
-        if cmd.command == f"{ext.name}.hideFolder":
-            cmd.title = "Hide Folder in workspace"
-        if cmd.command == f"{ext.name}.showFolder":
-            cmd.title = "Show Folder in workspace"
-    package_json.contributes.configuration = {
+    package_path = repo_root / "package.json"
+    package_json = json.loads(package_path.read_text(encoding="utf-8"))
+    package_json["displayName"] = "Hide Folder"
+    package_json["description"] = __doc__.strip()
+    contributes = package_json.setdefault("contributes", {})
+    for cmd in contributes.get("commands", []):
+        if cmd["command"] == f"{ext.name}.hideFolder":
+            cmd["title"] = "Hide Folder in workspace"
+        if cmd["command"] == f"{ext.name}.showFolder":
+            cmd["title"] = "Show Folder in workspace"
+    contributes["configuration"] = {
         "title": ext.name,
         "properties": {
             f"{ext.name}.hidden_folders": {
@@ -238,7 +292,7 @@ def update_package_json() -> None:
             }
         },
     }
-    package_json.contributes.menus["explorer/context"] = [
+    contributes.setdefault("menus", {})["explorer/context"] = [
         {
             "when": "workbenchState == workspace && explorerResourceIsRoot",
             "command": f"{ext.name}.hideFolder",
@@ -250,22 +304,22 @@ def update_package_json() -> None:
             "group": "2_workspace",
         },
     ]
-    package_json.repository = {
+    package_json["repository"] = {
         "type": "git",
         "url": "https://github.com/zcold/hide-folder.git",
     }
-    package_json.bugs = {
+    package_json["bugs"] = {
         "url": "https://github.com/zcold/hide-folder/issues",
     }
-    package_json.publishers = ["semispot-ab"]
-    package_json.homepage = "https://github.com/zcold/hide-folder/blob/main/README.md"
-    package_json.license = "MIT"
-    package_json.categories = ["Other"]
-    package_json.keywords = ["vscode", "extension", "workspace", "folder", "hide"]
-    package_json.extensionKind = ["workspace"]
-    package_json.pricing = "free"
-
-    anyconfig.dump(package_json, repo_root / "package.json", "json", indent=4)
+    package_json["publishers"] = ["semispot-ab"]
+    package_json["homepage"] = "https://github.com/zcold/hide-folder/blob/main/README.md"
+    package_json["license"] = "MIT"
+    package_json["categories"] = ["Other"]
+    package_json["keywords"] = ["vscode", "extension", "workspace", "folder", "hide"]
+    package_json["extensionKind"] = ["workspace"]
+    package_json["pricing"] = "free"
+
+    package_path.write_text(json.dumps(package_json, indent=4), encoding="utf-8")
 
 
 if __name__ == "__main__":